@@ -1,24 +1,54 @@
 import sys
 import os
 import re
+import time
 import asyncio
+import contextlib
 
 from slack_bolt.async_app import AsyncApp
 from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 
+try:
+    import uvloop                   # faster libuv-based event loop (POSIX only)
+except ImportError:
+    uvloop = None
+
 relative_path = os.path.join(os.path.dirname(__file__), '../../')
 sys.path.append(relative_path)
 
 from tools import (
     get_slack_channels,
     search_slack,
+    search_slack_batch,
     get_thread_messages,
     PromptUser,
     send_slack_message,
+    close_slack_clients,
 )
-from sys_prompt import get_system_prompt
+from sys_prompt import get_context_prompt, get_static_system_prompt
 from libs.agent.agent import Agent
 
+# Leading bot mention, e.g. "<@U123ABC> hello"
+_MENTION_RE = re.compile(r"^<@[^>]+>\s*")
+
+# Minimum seconds between placeholder edits while a reply streams in;
+# chat.update is rate limited per channel.
+STREAM_UPDATE_INTERVAL = 1.0
+
+
+async def stream_reply(client, channel: str, ts: str, replies) -> None:
+    """Edit the placeholder message at *ts* as the agent's reply grows."""
+    text, shown, last_update = "", "", 0.0
+    # Close the stream if an update fails, so the agent's turn ends too
+    async with contextlib.aclosing(replies):
+        async for text in replies:
+            now = time.monotonic()
+            if text and now - last_update >= STREAM_UPDATE_INTERVAL:
+                await client.chat_update(channel=channel, ts=ts, text=text)
+                shown, last_update = text, now
+    if text != shown:
+        await client.chat_update(channel=channel, ts=ts, text=text)
+
 async def main():
     # Slack credentials
     bot_token  = os.environ["SLACK_BOT_TOKEN"]
@@ -27,10 +57,12 @@ async def main():
     # Initialise the LLM-powered agent
     async with Agent(
         model_name="gpt-4o-mini",
-        instruction=get_system_prompt(),
+        instruction=get_static_system_prompt(),
+        context=get_context_prompt(),
         functions=[
             get_slack_channels,
             search_slack,
+            search_slack_batch,
             get_thread_messages,
             PromptUser,
             send_slack_message,
@@ -47,18 +79,18 @@ async def main():
             """
             raw_text = body["event"]["text"]
             # Remove only the leading bot mention (e.g. "<@U123ABC> hello" → "hello")
-            user_text = re.sub(r"^<@[^>]+>\s*", "", raw_text).strip()
+            user_text = _MENTION_RE.sub("", raw_text, count=1).strip()
             if not user_text:
                 await say("Please include a question after mentioning me.")
                 return
 
             thread_ts = body["event"].get("thread_ts", body["event"]["ts"])
             thinking_message = await say("🧠 Thinking…", thread_ts=thread_ts)
-            response = await agent.prompt(user_text)
-            await slack_app.client.chat_update(
-                channel=body["event"]["channel"],
-                ts=thinking_message["ts"],
-                text=response,
+            await stream_reply(
+                slack_app.client,
+                body["event"]["channel"],
+                thinking_message["ts"],
+                agent.astream_prompt(user_text),
             )
 
         # Handle direct messages
@@ -75,18 +107,28 @@ async def main():
                 return
 
             # Show “thinking…” indicator
-            await say("🧠 Thinking…")
+            thinking_message = await say("🧠 Thinking…")
 
-            # 1️⃣  Normal assistant response
-            reply = await agent.prompt(text)
-            await say(reply)
+            # 1️⃣  Normal assistant response, streamed into the indicator
+            await stream_reply(
+                slack_app.client,
+                event["channel"],
+                thinking_message["ts"],
+                agent.astream_prompt(text),
+            )
 
         # Websocket listener
         handler = AsyncSocketModeHandler(slack_app, app_token)
-        await handler.start_async()       # blocks forever (Ctrl-C to quit)
+        try:
+            await handler.start_async()   # blocks forever (Ctrl-C to quit)
+        finally:
+            await close_slack_clients()
 
 if __name__ == "__main__":
+    loop_factory = (
+        uvloop.new_event_loop if uvloop and sys.platform != "win32" else None
+    )
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=loop_factory)
     except (KeyboardInterrupt, SystemExit):
         print("\n👋 Goodbye!")
@@ -3,7 +3,7 @@ import json
 import logging
 import os
 import uuid
-from typing import Callable, Dict, List, Optional
+from typing import AsyncIterator, Callable, Dict, List, Optional
 
 from langchain_openai import ChatOpenAI           # requires langchain-openai ≥0.1.6
 from langchain.schema.messages import AIMessage
@@ -11,6 +11,17 @@ from langchain.schema.messages import AIMessage
 from .tool import create_enhanced_tool
 from .workflow import build_conversation_graph
 
+logger = logging.getLogger(__name__)
+
+SUMMARY_PREFIX = "[Prior context summary] "
+SUMMARY_INSTRUCTION = (
+    "Summarize the prior conversation below for your own future reference. "
+    "Keep user goals, decisions, channels and keywords searched, key findings "
+    "with their permalinks, and open questions. Be concise."
+)
+# Tool output is often long search dumps; the summary only needs the gist
+SUMMARY_TOOL_CHARS = 1000
+
 
 class Agent:
     """
@@ -26,18 +37,23 @@ class Agent:
             "You are a store-support API assistant that helps with online orders."
         ),
         functions: List[Callable] | None = None,
+        context: Optional[str] = None,
         openai_api_base: Optional[str] = None,
         openai_api_key: Optional[str] = None,
+        max_history_turns: int = 16,
     ) -> None:
         self.model_name = model_name
         self.instruction = instruction.strip()
+        self.context = context.strip() if context else None
         self.functions: List[Callable] = functions or []
+        self._max_history_turns = max_history_turns
 
-        # ChatOpenAI instance (streaming off, temperature fixed to 0)
+        # ChatOpenAI instance (streaming on, temperature fixed to 0)
      
         self._model = ChatOpenAI(
             model=model_name,
             temperature=0,
+            streaming=True,
             #base_url=openai_api_base or os.getenv("OPENAI_API_BASE"),
             #base_url='http://localhost:11434/v1',
             #openai_api_key ="ollama",
@@ -50,10 +66,16 @@ class Agent:
         # Map tool name → python callable
         self._tool_map: Dict[str, Callable] = {fn.__name__: fn for fn in self.functions}
 
-        # Running chat history (OpenAI message dicts)
+        # Running chat history (OpenAI message dicts). The static instruction
+        # leads so the provider can cache it as a prompt prefix; volatile
+        # context follows in its own system message.
         self._messages: List[Dict] = [
             {"role": "system", "content": self.instruction}
         ]
+        if self.context:
+            self._messages.append({"role": "system", "content": self.context})
+        # Leading system messages that are never summarized away
+        self._prefix_len = len(self._messages)
 
         # Compile graph
         self._graph = build_conversation_graph(
@@ -62,6 +84,12 @@ class Agent:
             tool_map=self._tool_map,
         )
 
+        # The app shares one Agent across Slack events; turns read and
+        # replace self._messages, so only one may run at a time
+        self._turn_lock = asyncio.Lock()
+        # Background history compaction, started after a turn's reply
+        self._compaction: Optional[asyncio.Task] = None
+
         self._terminated = False
         logging.basicConfig(level=logging.INFO)
 
@@ -75,24 +103,116 @@ class Agent:
             await self.prompt("END")
         finally:
             self._terminated = True
+            if self._compaction is not None:
+                self._compaction.cancel()
 
     # public API
     async def prompt(self, prompt: str) -> str:
-        if self._terminated:
-            raise RuntimeError("Agent has been terminated.")
-
-        if prompt == "END":
-            self._terminated = True
-            return ""
-
-        self._messages.append({"role": "user", "content": prompt})
-        state_out = self._graph.invoke({"messages": self._messages, "tool_calls": []})
-        self._messages = state_out["messages"]
+        reply = ""
+        async for reply in self.astream_prompt(prompt):
+            pass
+        return reply
+
+    async def astream_prompt(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Like prompt(), but yield the text of the current model call as it
+        streams in; the last value yielded is the final reply.
+        """
+        async with self._turn_lock:
+            if self._terminated:
+                raise RuntimeError("Agent has been terminated.")
+
+            if prompt == "END":
+                self._terminated = True
+                yield ""
+                return
+
+            # History is only replaced once the turn completes, so a stream
+            # closed early leaves no unanswered user message behind
+            messages = self._messages + [{"role": "user", "content": prompt}]
+
+            state_out: Dict = {}
+            buffer, run_id = "", None
+            async for mode, data in self._graph.astream(
+                {"messages": messages, "tool_calls": []},
+                stream_mode=["messages", "values"],
+            ):
+                if mode == "values":
+                    state_out = data
+                    continue
+                chunk, meta = data
+                if meta.get("langgraph_node") != "llm":
+                    continue
+                if not isinstance(chunk.content, str) or not chunk.content:
+                    continue
+                if chunk.id != run_id:      # new model call, e.g. after tool results
+                    buffer, run_id = "", chunk.id
+                buffer += chunk.content
+                yield buffer
+
+            self._messages = state_out["messages"]
+            # Summarize in the background so the reply is not held up
+            if self._compaction is None or self._compaction.done():
+                self._compaction = asyncio.create_task(self._compact_history())
+            yield state_out.get("last_reply", "")
+
+    async def _compact_history(self) -> None:
+        """
+        Once history exceeds ``max_history_turns`` turns, fold all but the
+        last half of them into a rolling summary after the system prefix.
+        Folding down to half leaves room to grow, so the summary (and the
+        cacheable prompt prefix it belongs to) stays stable for several
+        turns instead of being rewritten every turn.
+
+        Runs as a background task between turns. The summary is only
+        applied, under the turn lock, if the summarized messages are still
+        in place.
+        """
+        if len(self._messages) <= 2 * self._max_history_turns + self._prefix_len:
+            return
+
+        user_idxs = [
+            i for i, msg in enumerate(self._messages) if msg["role"] == "user"
+        ]
+        if len(user_idxs) <= self._max_history_turns:
+            return
 
-        for msg in reversed(self._messages):
-            if msg["role"] == "assistant" and isinstance(msg["content"], str):
-                return msg["content"]
-        return ""
+        # Cut on a user message so tool calls stay paired with their results
+        keep = max(1, self._max_history_turns // 2)
+        start, cut = self._prefix_len, user_idxs[-keep]
+        head = self._messages[start:cut]
+        try:
+            summary = await self._summarize(head)
+        except Exception:
+            logger.exception("History summarization failed; keeping full history")
+            return
+
+        async with self._turn_lock:
+            if self._messages[start:cut] != head:
+                logger.info("History changed during summarization; skipping")
+                return
+            self._messages[start:cut] = [
+                {"role": "system", "content": SUMMARY_PREFIX + summary}
+            ]
+
+    async def _summarize(self, messages: List[Dict]) -> str:
+        """Condense *messages* (including any earlier summary) into text."""
+        lines = []
+        for msg in messages:
+            content = msg.get("content")
+            if not isinstance(content, str) or not content:
+                continue
+            if msg["role"] == "tool":
+                content = content[:SUMMARY_TOOL_CHARS]
+            lines.append(f"{msg['role']}: {content}")
+
+        resp: AIMessage = await self._model.ainvoke(
+            [
+                {"role": "system", "content": SUMMARY_INSTRUCTION},
+                {"role": "user", "content": "\n\n".join(lines)},
+            ]
+        )
+        return resp.content if isinstance(resp.content, str) else ""
 
     async def thoughts(self, watermark: int) -> List[str]:
         """Return assistant messages *after* the given watermark index."""
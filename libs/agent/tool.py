@@ -3,11 +3,17 @@ Convert python functions (with optional dataclass argument) into the JSON schema
 required by the OpenAI function-calling API.
 """
 
+import copy
+import functools
 import inspect
 import json
-from dataclasses import fields, is_dataclass
+import types
+from dataclasses import MISSING, fields, is_dataclass
 from typing import Any, Dict, List, Union, get_args, get_origin
 
+# typing.Union[X, Y] / Optional[X] and PEP 604 X | Y have different origins
+_UNION_ORIGINS = (Union, types.UnionType)
+
 def _convert_type_to_schema(t: Any, field_name: str) -> Dict[str, Any]:
     if is_dataclass(t):
         return _dataclass_to_schema(t)
@@ -20,19 +26,44 @@ def _convert_type_to_schema(t: Any, field_name: str) -> Dict[str, Any]:
     if t is bool:
         return {"type": "boolean"}
 
+    origin = get_origin(t)
+    if origin in _UNION_ORIGINS:
+        # Optional[T] → T; nullability is conveyed by "required"
+        args = [a for a in get_args(t) if a is not type(None)]
+        if len(args) == 1:
+            return _convert_type_to_schema(args[0], field_name)
+    if t is list or origin is list:
+        args = get_args(t)
+        items = _convert_type_to_schema(args[0], field_name) if args else {}
+        return {"type": "array", "items": items}
+    if t is dict or origin is dict:
+        return {"type": "object"}
+
     return {"type": "string", "description": f"{field_name} ({t})"}
 
 
+@functools.lru_cache(maxsize=None)
 def _dataclass_to_schema(cls: type) -> Dict[str, Any]:
     schema = {"type": "object", "properties": {}, "required": []}
 
     for f in fields(cls):
         schema["properties"][f.name] = _convert_type_to_schema(f.type, f.name)
-        if f.default is inspect._empty and f.default_factory is inspect._empty:
+        if f.default is MISSING and f.default_factory is MISSING:
             schema["required"].append(f.name)
     return schema
 
 def create_function_schema(func: callable) -> Dict[str, Any]:
+    """Return the function-calling schema for *func*.
+
+    The result is a fresh copy, so callers may modify it freely.
+    """
+    return copy.deepcopy(_function_schema(func))
+
+
+# Cached schemas are shared and must not be modified; only copies of them
+# leave this module.
+@functools.lru_cache(maxsize=None)
+def _function_schema(func: callable) -> Dict[str, Any]:
     sig = inspect.signature(func)
     params = [
         (name, p)
@@ -46,7 +77,7 @@ def create_function_schema(func: callable) -> Dict[str, Any]:
     param_type = param.annotation
 
     # Unwrap Optional[T]
-    if get_origin(param_type) is Union:
+    if get_origin(param_type) in _UNION_ORIGINS:
         args = [a for a in get_args(param_type) if a is not type(None)]
         param_type = args[0] if args else param_type
 
@@ -66,12 +97,21 @@ def create_function_schema(func: callable) -> Dict[str, Any]:
     }
 
 
+# Schemas are pure w.r.t. the functions, so repeated Agent construction
+# with the same tool list reuses the first result.
+_TOOL_LIST_CACHE: Dict[tuple, List[Dict]] = {}
+
+
 def create_enhanced_tool(functions: List[callable]) -> List[Dict]:
     """Return a list of OpenAI-compatible function-schemas."""
-    schemas: List[Dict] = []
-    for fn in functions:
-        try:
-            schemas.append(create_function_schema(fn))
-        except Exception as err:
-            print(f"[tool-schema] skipping {fn.__name__}: {err}")
-    return schemas
\ No newline at end of file
+    key = tuple(functions)
+    schemas = _TOOL_LIST_CACHE.get(key)
+    if schemas is None:
+        schemas = []
+        for fn in functions:
+            try:
+                schemas.append(_function_schema(fn))
+            except Exception as err:
+                print(f"[tool-schema] skipping {fn.__name__}: {err}")
+        _TOOL_LIST_CACHE[key] = schemas
+    return copy.deepcopy(schemas)
@@ -1,138 +1,254 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
+import hashlib
 import inspect
-import json
 import random
 import time
 import logging
-from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Union
+import operator
+from collections import OrderedDict
+from typing import Annotated, Any, Callable, Dict, List, NamedTuple, TypedDict, Union
 
 import openai                             
+import orjson
 from langchain_openai import ChatOpenAI
 from langchain.schema.messages import AIMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class GraphState:
-    messages: List[Dict] = field(default_factory=list)   # OpenAI-style chat msgs
-    tool_calls: List[Dict] | None = field(default_factory=list)
+# Read-only tools whose results can be reused, with their TTL in seconds.
+# Side-effecting or interactive tools (send_slack_message, PromptUser) must
+# never be listed here, nor search_slack_batch, which reports failed
+# searches inline next to the successful ones.
+CACHEABLE_TOOLS: Dict[str, int] = {
+    "get_slack_channels": 300,
+    "search_slack": 60,
+    "get_thread_messages": 120,
+}
+TOOL_CACHE_MAXSIZE = 256
 
-def _parse_call(call: Dict, idx: int) -> tuple[str, str, dict]:
-    """
-    Return (tool_call_id, fn_name, fn_args) for both old and new OpenAI schemas.
-    """
-    if "name" in call:                                    # legacy flat format
-        fn_name = call["name"]
-        raw_args = call.get("arguments", "{}")
-        tool_call_id = call.get("id") or f"legacy_{idx}_{fn_name}"
-    else:                                                 # new nested format
-        fn_name = call["function"]["name"]
-        raw_args = call["function"].get("arguments", "{}")
-        tool_call_id = call["id"]
-    fn_args = json.loads(raw_args) if isinstance(raw_args, str) else raw_args
-    return tool_call_id, fn_name, fn_args
+# (fn_name, args digest) → (stored_at, serialized tool content), LRU ordered
+_tool_cache: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
 
+class GraphState(TypedDict):
+    # OpenAI-style chat msgs; nodes return only the messages they add
+    messages: Annotated[List[Dict], operator.add]
+    tool_calls: List[Dict]
+    # Text of the latest model reply, so callers need not scan messages
+    last_reply: str
 
-def build_conversation_graph(
-    *,
-    model: ChatOpenAI,
-    functions_schema: List[Dict],
-    tool_map: Dict[str, Callable],
-    ):
+class ParsedCall(NamedTuple):
+    id: str
+    name: str
+    args: dict
+
+
+def _decode_args(raw_args: str | dict) -> dict:
+    return orjson.loads(raw_args) if isinstance(raw_args, str) else raw_args
+
+
+def _parse_legacy_call(call: Dict, idx: int) -> ParsedCall:
+    """Parse the legacy flat format: {"name": ..., "arguments": ...}."""
+    fn_name = call["name"]
+    return ParsedCall(
+        call.get("id") or f"legacy_{idx}_{fn_name}",
+        fn_name,
+        _decode_args(call.get("arguments", "{}")),
+    )
+
+
+def _parse_tool_call(call: Dict) -> ParsedCall:
+    """Parse the current nested format: {"id": ..., "function": {...}}."""
+    function = call["function"]
+    return ParsedCall(
+        call["id"],
+        function["name"],
+        _decode_args(function.get("arguments", "{}")),
+    )
+
+
+def _analyze_tool(fn: Callable) -> tuple[Any, bool, str, bool] | None:
     """
-    LangGraph with two nodes:
-      • llm_node  call the LLM (with OpenAI tool calling)
-      • tool_node execute python tools requested by the LLM
+    Return (param_type, is_dataclass, param_name, is_async) for a tool so
+    tool_node can dispatch without reflecting on every call, or None if the
+    tool takes no argument (such tools get no schema and cannot be called).
     """
+    first_param = next(iter(inspect.signature(fn).parameters.values()), None)
+    if first_param is None:
+        return None
+    param_type = first_param.annotation
+    is_dc = inspect.isclass(param_type) and dataclasses.is_dataclass(param_type)
+    return param_type, is_dc, first_param.name, inspect.iscoroutinefunction(fn)
 
 
-    graph = StateGraph(dict)
-
-    MAX_RETRIES = 5
-
-    # LLM node 
-    def llm_node(state: Dict) -> Dict:
-        msgs = state["messages"]
-
-        for attempt in range(MAX_RETRIES):
-            try:
-                openai_tools = [
-                    {"type": "function", "function": f}  
-                    for f in functions_schema             
-                ]
-                resp: AIMessage = model.invoke(
-                    msgs,
-                    tools=openai_tools,
-                    temperature=0,
-                )
-                break
-            except openai.RateLimitError:
-                backoff = (2 ** attempt) + random.random()
-                time.sleep(backoff)
-        else:
-            raise
+def _cache_key(fn_name: str, fn_args: Any) -> tuple[str, str]:
+    """Key a tool call by name and canonicalized (key-sorted) arguments."""
+    canonical = orjson.dumps(fn_args, default=str, option=orjson.OPT_SORT_KEYS)
+    return fn_name, hashlib.blake2b(canonical, digest_size=16).hexdigest()
 
-        resp_dict = {
-            "role": "assistant",
-            "content": resp.content,        
-            **resp.additional_kwargs,          
-        }
 
-        msgs.append(resp_dict)
-        state["tool_calls"] = resp_dict.get("tool_calls", [])
-        return state
+def _cache_get(key: tuple[str, str]) -> str | None:
+    """Return cached tool content for *key* if present and not expired."""
+    ttl = CACHEABLE_TOOLS.get(key[0])
+    entry = _tool_cache.get(key) if ttl is not None else None
+    if entry is None:
+        return None
+    stored_at, content = entry
+    if time.monotonic() - stored_at > ttl:
+        del _tool_cache[key]
+        return None
+    _tool_cache.move_to_end(key)
+    return content
 
-    # Tool node 
-    def tool_node(state: Dict) -> Dict:
-        msgs = state["messages"]
-        results: List[Dict] = []
 
-        for idx, call in enumerate(state["tool_calls"]):
-            tool_call_id, fn_name, fn_args = _parse_call(call, idx)
-            logger.info(
-                "Executing tool",
-                extra={"tool": fn_name, "tool_args": fn_args},
-            )
+def _cache_put(key: tuple[str, str], content: str) -> None:
+    if key[0] not in CACHEABLE_TOOLS:
+        return
+    _tool_cache[key] = (time.monotonic(), content)
+    _tool_cache.move_to_end(key)
+    while len(_tool_cache) > TOOL_CACHE_MAXSIZE:
+        _tool_cache.popitem(last=False)
 
-            if fn_name not in tool_map:
-                logger.warning("Unknown tool requested", extra={"tool": fn_name})
-                continue
-
-            py_fn = tool_map[fn_name]
-
-            sig = inspect.signature(py_fn)
-            first_param = next(iter(sig.parameters.values()))
-            param_name = first_param.name
-            param_type = first_param.annotation
-
-            try:
-                if inspect.isclass(param_type) and hasattr(param_type, "__dataclass_fields__"):
-                    # If LLM wrapped args like {"request": {...}}, unwrap first
-                    if len(fn_args) == 1 and param_name in fn_args:
-                        fn_args = fn_args[param_name]
-                    out = py_fn(param_type(**fn_args))
-                else:
-                    out = py_fn(fn_args)
-                content = json.dumps({"content": out})
-            except Exception as err:
-                logger.exception("Tool execution failed", extra={"tool": fn_name})
-                content = json.dumps({"error": str(err)})
-
-            results.append(
-                {
-                    "role": "tool",
-                    "tool_call_id": tool_call_id,
-                    "name": fn_name,
-                    "content": content,
-                }
+
+MAX_RETRIES = 5
+
+
+# LLM node 
+async def llm_node(state: GraphState, config: RunnableConfig) -> Dict:
+    bound = config["configurable"]
+    model: ChatOpenAI = bound["model"]
+    msgs = state["messages"]
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            resp: AIMessage = await model.ainvoke(
+                msgs,
+                tools=bound["openai_tools"],
+                temperature=0,
             )
+            break
+        except openai.RateLimitError:
+            backoff = (2 ** attempt) + random.random()
+            await asyncio.sleep(backoff)
+    else:
+        raise
+
+    resp_dict = {
+        "role": "assistant",
+        "content": resp.content,        
+        **resp.additional_kwargs,          
+    }
+
+    return {
+        "messages": [resp_dict],
+        "tool_calls": resp_dict.get("tool_calls", []),
+        "last_reply": resp.content if isinstance(resp.content, str) else "",
+    }
+
 
-        msgs.extend(results)
-        state["tool_calls"] = []
-        return state
+# Tool node 
+async def tool_node(state: GraphState, config: RunnableConfig) -> Dict:
+    bound = config["configurable"]
+    tool_map: Dict[str, Callable] = bound["tool_map"]
+    tool_meta: Dict[str, tuple] = bound["tool_meta"]
+
+    async def execute(
+        fn_name: str, fn_args: Any, cache_key: tuple[str, str]
+    ) -> str | None:
+        logger.info(
+            "Executing tool",
+            extra={"tool": fn_name, "tool_args": fn_args},
+        )
+
+        meta = tool_meta.get(fn_name)
+        if meta is None:
+            logger.warning("Unknown tool requested", extra={"tool": fn_name})
+            return None
+
+        content = _cache_get(cache_key)
+        if content is not None:
+            logger.info("Tool cache hit", extra={"tool": fn_name})
+            return content
+
+        py_fn = tool_map[fn_name]
+        param_type, is_dc, param_name, is_async = meta
+
+        try:
+            if is_dc:
+                # If LLM wrapped args like {"request": {...}}, unwrap first
+                if len(fn_args) == 1 and param_name in fn_args:
+                    fn_args = fn_args[param_name]
+                arg = param_type(**fn_args)
+            else:
+                arg = fn_args
+            if is_async:
+                out = await py_fn(arg)
+            else:
+                # Blocking tools run off the event loop
+                out = await asyncio.to_thread(py_fn, arg)
+            content = orjson.dumps({"content": out}).decode()
+            # Failures raise and land in the except below, so they are
+            # never cached
+            _cache_put(cache_key, content)
+        except Exception as err:
+            logger.exception("Tool execution failed", extra={"tool": fn_name})
+            content = orjson.dumps({"error": str(err)}).decode()
+        return content
+
+    # Branch on the format here so each parser stays monomorphic
+    calls = [
+        _parse_legacy_call(call, idx) if "name" in call else _parse_tool_call(call)
+        for idx, call in enumerate(state["tool_calls"])
+    ]
+
+    # Identical calls to read-only tools within one turn execute once and
+    # share the result; every other call runs on its own
+    runs: Dict[tuple[str, str], Any] = {}
+    keys: List[tuple[str, str]] = []
+    for idx, call in enumerate(calls):
+        if call.name in CACHEABLE_TOOLS:
+            key = _cache_key(call.name, call.args)
+        else:
+            key = (call.name, f"#{idx}")
+        keys.append(key)
+        if key in runs:
+            logger.info("Duplicate tool call skipped", extra={"tool": call.name})
+        else:
+            runs[key] = execute(call.name, call.args, key)
+
+    # Independent tool calls run concurrently
+    contents = dict(zip(runs, await asyncio.gather(*runs.values())))
+
+    results: List[Dict] = []
+    for call, key in zip(calls, keys):
+        if contents[key] is None:
+            continue
+        results.append(
+            {
+                "role": "tool",
+                "tool_call_id": call.id,
+                "name": call.name,
+                "content": contents[key],
+            }
+        )
+
+    return {"messages": results, "tool_calls": []}
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_graph():
+    """
+    LangGraph with two nodes, compiled once per process:
+      • llm_node  call the LLM (with OpenAI tool calling)
+      • tool_node execute python tools requested by the LLM
+    The model and tools are read from config["configurable"].
+    """
+    graph = StateGraph(GraphState)
 
     # Graph nodes
     graph.add_node("llm", llm_node)
@@ -145,3 +261,27 @@ def build_conversation_graph(
     graph.add_edge("tool", "llm")
 
     return graph.compile()
+
+
+def build_conversation_graph(
+    *,
+    model: ChatOpenAI,
+    functions_schema: List[Dict],
+    tool_map: Dict[str, Callable],
+    ):
+    """
+    Bind a model and its tools to the shared compiled graph. Only the
+    per-agent bindings are built here; the graph itself is compiled once.
+    """
+    return _compiled_graph().with_config(
+        configurable={
+            "model": model,
+            # Tool payload is constant for the agent's lifetime; build it once
+            "openai_tools": [
+                {"type": "function", "function": f}
+                for f in functions_schema
+            ],
+            "tool_map": tool_map,
+            "tool_meta": {name: _analyze_tool(fn) for name, fn in tool_map.items()},
+        }
+    )
@@ -1,12 +1,9 @@
 from datetime import datetime
 
-def get_system_prompt() -> str:
-    """Returns the system prompt with the current date and time"""
-    # Get the current time in ISO format
-    current_time = datetime.now().isoformat()
-
-    # Base system prompt template
-    system_prompt_template = """
+# Static instructions. Kept byte-identical across turns and restarts so the
+# provider can serve this prefix from its prompt cache; anything volatile
+# belongs in get_context_prompt().
+SYSTEM_PROMPT = """
 You are Celestis, an assistant specialized in answering general questions and in searching and analyzing a company's internal Slack conversations.
 
 Your demeanor mirrors the computer aboard the USS Enterprise:
@@ -64,6 +61,7 @@ When provided with a query, follow this structured approach:
 	•	Structure searches to maximize relevant results.
 	•	Drop redundant keywords if scoped by channels.
 	•	Must show us the keywords and the channels you've used for the search
+	•	Run steps 4 and 5 together: emit a single search_slack_batch call containing every global and channel-based keyword-group search instead of separate search_slack calls.
 
 6. Analyze Search Results
 	•	Do not complete analysis until both global and channel-based searches are performed.
@@ -96,9 +94,16 @@ When provided with a query, follow this structured approach:
 Always be transparent about the scope of your search and which channels were included. Clearly communicate any limitations or uncertainties in your analysis, and propose improvements or follow-ups as appropriate.
 
 Must prettify the final report.
-
-Current date and time: {}
 """
 
-    # Return the system prompt with the current time injected
-    return system_prompt_template.format(current_time)
+
+def get_static_system_prompt() -> str:
+    """Returns the cacheable system prompt without any volatile context"""
+    return SYSTEM_PROMPT
+
+
+def get_context_prompt() -> str:
+    """Returns the volatile context (current date and time) for the prompt"""
+    # Get the current time in ISO format
+    current_time = datetime.now().isoformat()
+    return "Current date and time: {}".format(current_time)
@@ -1,64 +1,295 @@
+import asyncio
 import os
 import logging
 import re
-from dataclasses import dataclass
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from itertools import chain
+from urllib.parse import urlparse, parse_qs
 
-from slack_sdk import WebClient
+import aiohttp
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_async_handlers import AsyncRateLimitErrorRetryHandler
+from slack_sdk.web.async_client import AsyncWebClient
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 MENTION_RE = re.compile(r"<@([A-Z0-9]+)>")
+# Message segment of a Slack permalink, e.g. p1717518829123456
+SLACK_TS_RE = re.compile(r"^p(\d{10})(\d+)$")
+# Timestamp format used when listing search results
+RESULT_TS_FORMAT = "%Y-%m-%d %H:%M"
+# Characters of message text shown per search result
+MATCH_TEXT_LIMIT = 200
+
+def _user_token_error(token: Optional[str]) -> Optional[str]:
+    """Return why *token* cannot be used as a Slack user token, if it can't."""
+    if not token:
+        return "SLACK_USER_TOKEN environment variable is required"
+    if not token.startswith("xoxp-"):
+        return (
+            "Invalid token type. API requires a User Token starting with "
+            f"'xoxp-', got token starting with '{token[:5]}'"
+        )
+    return None
+
+# The user token is resolved and validated once, at import
+_SLACK_USER_TOKEN = os.environ.get("SLACK_USER_TOKEN")
+_SLACK_USER_TOKEN_ERROR = _user_token_error(_SLACK_USER_TOKEN)
 
-# Simple in-memory cache for Slack user lookups
-_user_cache: Dict[str, str] = {}
 
+def _require_user_token(token: Optional[str] = None) -> str:
+    """Return *token*, or the SLACK_USER_TOKEN from the environment.
 
-def _get_user_name(client: WebClient, user_id: str, team_id: str | None = None) -> str:
+    Raises:
+        ValueError: If the token is missing or not a user (xoxp-) token
+    """
+    error = _user_token_error(token) if token else _SLACK_USER_TOKEN_ERROR
+    if error:
+        raise ValueError(error)
+    return token or _SLACK_USER_TOKEN
+
+# Bounded LRU cache for Slack user lookups (user ID → name). User IDs are
+# unique across workspaces, so the team is only needed to call users.info
+# and each user takes a single entry.
+USER_CACHE_MAXSIZE = 8192
+_user_cache: OrderedDict[str, str] = OrderedDict()
+
+
+def _cache_user(user_id: str, name: str) -> None:
+    """Store a resolved name, evicting the least recently used entry."""
+    _user_cache[user_id] = name
+    _user_cache.move_to_end(user_id)
+    if len(_user_cache) > USER_CACHE_MAXSIZE:
+        _user_cache.popitem(last=False)
+
+# One HTTP session (and its keep-alive connection pool) shared by every
+# Slack client, so tool calls skip the TCP+TLS handshake after the first.
+_session: Optional[aiohttp.ClientSession] = None
+_clients: Dict[str, AsyncWebClient] = {}
+# Caps users.info requests in flight across *all* concurrent tool calls;
+# created with the session so it belongs to the same event loop.
+_user_lookup_limiter: Optional[asyncio.Semaphore] = None
+
+# Connection pool sizing for the shared session. Every Slack call goes to
+# slack.com, so the per-host cap is what bounds concurrent requests.
+SLACK_POOL_SIZE = 64
+SLACK_POOL_SIZE_PER_HOST = 32
+SLACK_TIMEOUT = 30
+# Max concurrent users.info requests, shared by every tool call
+USER_LOOKUP_CONCURRENCY = 16
+
+
+def _get_client(token: str) -> AsyncWebClient:
+    """Return the shared Slack client for *token*.
+
+    Must be called from within the running event loop; the underlying
+    aiohttp session is created lazily on first use.
+    """
+    global _session, _user_lookup_limiter
+    if _session is None or _session.closed:
+        _user_lookup_limiter = asyncio.Semaphore(USER_LOOKUP_CONCURRENCY)
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=SLACK_POOL_SIZE,
+                limit_per_host=SLACK_POOL_SIZE_PER_HOST,
+                ttl_dns_cache=300,
+            )
+        )
+        _clients.clear()
+    client = _clients.get(token)
+    if client is None:
+        client = _clients[token] = AsyncWebClient(
+            token=token, session=_session, timeout=SLACK_TIMEOUT
+        )
+        # Wait out Retry-After on 429s (users.list is only Tier 2)
+        client.retry_handlers.append(AsyncRateLimitErrorRetryHandler(max_retry_count=2))
+    return client
+
+
+async def close_slack_clients() -> None:
+    """Close the shared HTTP session used by all Slack clients."""
+    global _session
+    for task in _user_prefetch.values():
+        task.cancel()
+    _user_prefetch.clear()
+    _user_prefetch_failed.clear()
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _clients.clear()
+
+
+# token → task loading that workspace's users.list into _user_cache
+_user_prefetch: Dict[str, asyncio.Task] = {}
+# token → time.monotonic() of its last failed load
+_user_prefetch_failed: Dict[str, float] = {}
+# users.list pages (200 members each) read per workspace; keeps the roster
+# well inside USER_CACHE_MAXSIZE
+USER_PREFETCH_MAX_PAGES = 20
+# Seconds to wait before retrying a failed roster load
+USER_PREFETCH_RETRY_AFTER = 300
+
+
+def _display_name(user: Dict[str, Any], fallback: str) -> str:
+    """Prefer the display name, then the real name, then the handle."""
+    profile = user.get("profile", {})
+    return (
+        profile.get("display_name")
+        or profile.get("real_name")
+        or user.get("name")
+        or fallback
+    )
+
+
+async def _get_user_name(client: AsyncWebClient, user_id: str, team_id: str | None = None) -> str:
     """Resolve a Slack user ID to a human-readable name.
 
     Looks up the user via the Slack API and prefers the display name,
     falling back to the real name or the raw ID if necessary. For Slack
     Connect users, the team_id can be supplied to look up remote profiles.
-    Results are cached locally for the lifetime of the process to minimize
-    API calls.
+    Results are kept in a bounded LRU cache to minimize API calls.
     """
     if not user_id:
         return "Unknown"
 
-    cache_key = f"{team_id}:{user_id}" if team_id else user_id
-    if cache_key in _user_cache:
-        return _user_cache[cache_key]
+    hit = _user_cache.get(user_id)
+    if hit is not None:
+        _user_cache.move_to_end(user_id)
+        return hit
+
+    # The first miss starts loading the workspace roster in the background
+    # so later lookups are answered from the cache; this one does not wait.
+    _start_workspace_prefetch(client)
     try:
         info = (
-            client.users_info(user=user_id, team=team_id)
+            await client.users_info(user=user_id, team=team_id)
             if team_id
-            else client.users_info(user=user_id)
-        )
-        user = info.get("user", {})
-        profile = user.get("profile", {})
-        name = (
-            profile.get("display_name")
-            or profile.get("real_name")
-            or user.get("name")
-            or user_id
+            else await client.users_info(user=user_id)
         )
-        _user_cache[cache_key] = name
+        name = _display_name(info.get("user", {}), user_id)
+        _cache_user(user_id, name)
         return name
     except SlackApiError:
-        _user_cache[cache_key] = user_id
+        _cache_user(user_id, user_id)
         return user_id
 
-@dataclass
+
+def _start_workspace_prefetch(client: AsyncWebClient) -> None:
+    """Start loading the token's workspace roster, once, in the background.
+
+    A failed or cancelled load is forgotten so a later miss retries it,
+    but not before USER_PREFETCH_RETRY_AFTER seconds have passed.
+    """
+    token = client.token
+    if token in _user_prefetch:
+        return
+    failed_at = _user_prefetch_failed.get(token)
+    if failed_at is not None and time.monotonic() - failed_at < USER_PREFETCH_RETRY_AFTER:
+        return
+
+    task = _user_prefetch[token] = asyncio.ensure_future(
+        _load_workspace_users(client)
+    )
+
+    def forget_failed(t: asyncio.Future) -> None:
+        if not t.cancelled() and t.exception() is None:
+            return
+        if _user_prefetch.get(token) is t:
+            del _user_prefetch[token]
+        if not t.cancelled():
+            error = t.exception()
+            if isinstance(error, SlackApiError):
+                error = error.response['error']
+            logger.warning("users.list prefetch failed: %s", error)
+            _user_prefetch_failed[token] = time.monotonic()
+
+    task.add_done_callback(forget_failed)
+
+
+async def _load_workspace_users(client: AsyncWebClient) -> None:
+    """Seed _user_cache with members of the token's workspace.
+
+    One paginated users.list replaces a users.info call per member. At most
+    USER_PREFETCH_MAX_PAGES pages are read, so the roster fits in the cache
+    alongside other lookups; anyone beyond that, and Slack Connect users
+    from other workspaces, are still looked up individually.
+
+    Raises:
+        SlackApiError: If a page cannot be fetched; the load is then retried
+    """
+    cursor = None
+    for _ in range(USER_PREFETCH_MAX_PAGES):
+        response = await client.users_list(limit=200, cursor=cursor)
+        for user in response.get("members", []):
+            uid = user["id"]
+            _cache_user(uid, _display_name(user, uid))
+        cursor = response.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            return
+
+
+def _message_team(msg: Dict[str, Any]) -> str | None:
+    """Return the team of a message's author, for Slack Connect lookups."""
+    return msg.get("team") or msg.get("user_team")
+
+
+def _author_refs(msg: Dict[str, Any], tid: str | None):
+    """Yield the (user_id, tid) of a message's author and @-mentions."""
+    if msg.get("user"):
+        yield msg["user"], tid
+    yield from ((uid, tid) for uid in MENTION_RE.findall(msg.get("text") or ""))
+
+
+def _iter_author_refs(msg: Dict[str, Any]):
+    """Yield the (user_id, team_id) of a message's author and @-mentions."""
+    return _author_refs(msg, _message_team(msg))
+
+
+def _iter_user_refs(msg: Dict[str, Any]):
+    """Yield every (user_id, team_id) a message refers to.
+
+    Covers the author, thread participants, reactors and @-mentions.
+    """
+    tid = _message_team(msg)
+    yield from _author_refs(msg, tid)
+    for ru in msg.get("reply_users") or ():
+        yield ru, tid
+    for reaction in msg.get("reactions") or ():
+        for ru in reaction.get("users") or ():
+            yield ru, tid
+
+
+def _replace_mentions(text: str, user_map: Dict[tuple, str], tid: str | None) -> str:
+    """Rewrite <@U123> mentions in *text* as @name using *user_map*."""
+    get = user_map.get
+    return MENTION_RE.sub(lambda m: "@" + get((m.group(1), tid), m.group(1)), text)
+
+
+async def _resolve_users_bulk(
+    client: AsyncWebClient, pairs
+) -> Dict[tuple, str]:
+    """Resolve (user_id, team_id) pairs to names concurrently."""
+    pairs = list(pairs)
+
+    async def lookup(uid: str, tid: str | None) -> str:
+        async with _user_lookup_limiter:
+            return await _get_user_name(client, uid, tid)
+
+    names = await asyncio.gather(*(lookup(uid, tid) for uid, tid in pairs))
+    return dict(zip(pairs, names))
+
+@dataclass(slots=True)
 class GetChannelsRequest:
     """Request parameters for getting Slack channels"""
     include_archived: bool = False
     include_private: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class SlackSearchRequest:
     """Request parameters for searching Slack messages"""
     query: str
@@ -69,16 +300,35 @@ class SlackSearchRequest:
     end_time: Optional[str] = None
     token: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
+class SlackSearchBatchRequest:
+    """Request parameters for running several Slack searches at once"""
+    searches: List[SlackSearchRequest]
+
+@dataclass(slots=True)
+class SlackMatch:
+    """The fields of a search match that are shown to the LLM"""
+    channel: str
+    user: str
+    text: str
+    ts: str
+    permalink: str
+    # " (YYYY-MM-DD HH:MM)" rendering of ts, computed once at construction
+    when: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        self.when = _format_ts(self.ts)
+
+@dataclass(slots=True)
 class SlackSearchResult:
     """Data class to hold Slack search results"""
     query: str
     total: int
-    matches: List[Dict[str, Any]]
+    matches: List[SlackMatch]
     pagination: Optional[Dict[str, Any]] = None
     has_more: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class ThreadInput:
     """
     Input object for `get_thread_messages`.
@@ -91,7 +341,7 @@ class ThreadInput:
     """
     thread_url: str
 
-@dataclass
+@dataclass(slots=True)
 class PromptUserRequest:
     """
     LLM may send either {"prompt": "..."}, {"q": "..."}, or {"text": "..."}.
@@ -104,10 +354,10 @@ class PromptUserRequest:
     @property
     def resolved_text(self) -> str:
         """Return whichever field was supplied."""
-        return self.prompt or self.q or self.text or ""
+        return _pick_text(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class SendMessageRequest:
     """Parameters for sending a Slack message."""
     text: str
@@ -115,6 +365,13 @@ class SendMessageRequest:
     channel: Optional[str] = None
 
 
+def _pick_text(src: PromptUserRequest | Dict[str, Any]) -> str:
+    """Return the first of prompt/q/text supplied in a request or raw dict."""
+    if isinstance(src, dict):
+        return src.get("prompt") or src.get("q") or src.get("text") or ""
+    return src.prompt or src.q or src.text or ""
+
+
 def PromptUser(args: PromptUserRequest | Dict[str, Any]) -> str:
     """
     Tell the outer application to ask the user something, then
@@ -124,14 +381,10 @@ def PromptUser(args: PromptUserRequest | Dict[str, Any]) -> str:
     The LangGraph runtime passes tool arguments as dictionaries, so we
     gracefully handle both dataclass instances and raw dicts.
     """
-    if isinstance(args, dict):
-        text = args.get("prompt") or args.get("q") or args.get("text") or ""
-    else:
-        text = args.resolved_text
-    return f"Awaiting user response: {text}"
+    return f"Awaiting user response: {_pick_text(args)}"
 
 
-def send_slack_message(request: SendMessageRequest) -> str:
+async def send_slack_message(request: SendMessageRequest) -> str:
     """Send a direct message or post to a channel using the bot token.
 
     Provide either a Slack user ID in ``user`` to send a DM or a channel ID in
@@ -146,28 +399,57 @@ def send_slack_message(request: SendMessageRequest) -> str:
     if not slack_token:
         raise ValueError("SLACK_BOT_TOKEN environment variable is required")
 
-    client = WebClient(token=slack_token)
+    client = _get_client(slack_token)
 
     try:
         if user:
-            conv = client.conversations_open(users=user)
+            conv = await client.conversations_open(users=user)
             channel_id = conv.get("channel", {}).get("id")
         elif channel:
             channel_id = channel
         else:
             raise ValueError("Either 'user' or 'channel' must be provided")
 
-        client.chat_postMessage(channel=channel_id, text=text)
+        await client.chat_postMessage(channel=channel_id, text=text)
         target = f"user {user}" if user else f"channel {channel}"
         return f"Message sent to {target}"
     except SlackApiError as e:
-        logger.error(f"Slack API error: {e.response['error']}")
+        logger.error("Slack API error: %s", e.response['error'])
         return f"Slack API error: {e.response['error']}"
     except Exception as e:
-        logger.error(f"Unexpected error sending message: {str(e)}")
+        logger.error("Unexpected error sending message: %s", e)
         return f"Error sending message: {str(e)}"
 
-def get_slack_channels(request: GetChannelsRequest) -> List[Dict[str, Any]]:
+async def _iter_channels(client: AsyncWebClient, *, exclude_archived: bool, types: str):
+    """Yield channels from conversations.list, following pagination cursors."""
+    cursor = None
+    while True:
+        response = await client.conversations_list(
+            exclude_archived=exclude_archived,
+            types=types,
+            limit=1000,  # Maximum allowed by Slack API
+            cursor=cursor,
+        )
+        channels = response.get("channels", [])
+
+        # Log channel information for debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Retrieved %d channels from Slack workspace", len(channels))
+            for channel in channels:
+                logger.debug("Channel: #%s (ID: %s, Members: %s, Archived: %s)",
+                             channel.get('name'), channel.get('id'),
+                             channel.get('num_members', 'N/A'),
+                #             channel.get('is_private', False),
+                             channel.get('is_archived', False))
+
+        for channel in channels:
+            yield channel
+
+        cursor = response.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            return
+
+async def get_slack_channels(request: GetChannelsRequest) -> List[Dict[str, Any]]:
     """Get a list of Slack channels from the workspace.
 
     Args:
@@ -177,16 +459,11 @@ def get_slack_channels(request: GetChannelsRequest) -> List[Dict[str, Any]]:
         List of channel dictionaries with id, name, and other metadata
 
     Raises:
-        ValueError: If SLACK_USER_TOKEN environment variable is not set
+        ValueError: If SLACK_USER_TOKEN is not set or is not a user token
         SlackApiError: If the Slack API request fails
     """
-    # Get API token from environment variable
-    slack_token = os.getenv("SLACK_USER_TOKEN")
-    if not slack_token:
-        raise ValueError("SLACK_USER_TOKEN environment variable is required")
-
     # Initialize Slack client
-    client = WebClient(token=slack_token)
+    client = _get_client(_require_user_token())
 
     try:
         # Determine channel types to include
@@ -194,41 +471,75 @@ def get_slack_channels(request: GetChannelsRequest) -> List[Dict[str, Any]]:
         #if request.include_private:
         #    channel_types.append("private_channel")
 
-        # Make the API request
-        response = client.conversations_list(
-            exclude_archived=not request.include_archived,
-            types=",".join(channel_types),
-            limit=1000  # Maximum allowed by Slack API
-        )
-
-        channels = response.get("channels", [])
-
-        # Log channel information for debugging
-        logger.debug(f"Retrieved {len(channels)} channels from Slack workspace")
-        for channel in channels:
-            logger.debug(f"Channel: #{channel.get('name')} (ID: {channel.get('id')}, "
-                        f"Members: {channel.get('num_members', 'N/A')}, "
-            #            f"Private: {channel.get('is_private', False)}, "
-                        f"Archived: {channel.get('is_archived', False)})")
-
-        # Return simplified channel data
-        simplified_channels = []
-        for channel in channels:
-            simplified_channels.append({
-                "name": channel.get("name"),
-            })
-
-        logger.debug(f"Returning {len(simplified_channels)} simplified channel records")
+        # Single pass over every page of channels
+        simplified_channels = [
+            {"name": channel.get("name")}
+            async for channel in _iter_channels(
+                client,
+                exclude_archived=not request.include_archived,
+                types=",".join(channel_types),
+            )
+        ]
+
+        logger.debug("Returning %d simplified channel records", len(simplified_channels))
         return simplified_channels
 
     except SlackApiError as e:
-        logger.error(f"Slack API error: {e.response['error']}")
+        logger.error("Slack API error: %s", e.response['error'])
         raise
     except Exception as e:
-        logger.error(f"Unexpected error retrieving Slack channels: {str(e)}")
+        logger.error("Unexpected error retrieving Slack channels: %s", e)
         raise
 
-def search_slack(request: SlackSearchRequest) -> SlackSearchResult | str:
+def _iso_to_date(value: str) -> str:
+    """Convert an ISO 8601 timestamp (``Z`` suffix allowed) to YYYY-MM-DD."""
+    return datetime.fromisoformat(value).strftime('%Y-%m-%d')
+
+def _build_search_query(
+    query: str,
+    channels: str | List[str] | None,
+    start_time: Optional[str],
+    end_time: Optional[str],
+) -> str:
+    """Build the search.messages query string with channel and date filters.
+
+    Args:
+        query: Search terms
+        channels: Channel names, with or without ``#``, comma separated or
+            as a list (models often send plural fields as arrays)
+        start_time: ISO 8601 lower bound; ignored if it cannot be parsed
+        end_time: ISO 8601 upper bound; ignored if it cannot be parsed
+
+    Returns:
+        The query string to pass to Slack
+    """
+    parts = [query.strip()]
+
+    # Add channel filters if specified
+    if channels:
+        if isinstance(channels, str):
+            channels = channels.split(',')
+        parts.extend(
+            f"in:{c}" if c.startswith('#') else f"in:#{c}"
+            for c in (x.strip() for x in channels)
+        )
+
+    # Add time filters if specified (ISO format only)
+    if start_time:
+        try:
+            parts.append(f"after:{_iso_to_date(start_time)}")
+        except ValueError:
+            logger.warning("Invalid start_time ISO format: %s, ignoring time filter", start_time)
+
+    if end_time:
+        try:
+            parts.append(f"before:{_iso_to_date(end_time)}")
+        except ValueError:
+            logger.warning("Invalid end_time ISO format: %s, ignoring time filter", end_time)
+
+    return " ".join(parts)
+
+async def search_slack(request: SlackSearchRequest) -> SlackSearchResult | str:
     """Search Slack messages across channels.
 
     Args:
@@ -241,18 +552,11 @@ def search_slack(request: SlackSearchRequest) -> SlackSearchResult | str:
         ValueError: If required parameters are missing or invalid
         SlackApiError: If the Slack API request fails
     """
-    # Get API token
-    slack_user_token = request.token or os.getenv("SLACK_USER_TOKEN")
-    if not slack_user_token:
-        return "SLACK_USER_TOKEN environment variable is required"
-
-    # Validate that it's a user token
-    if not slack_user_token.startswith("xoxp-"):
-        error_msg = (
-            "Invalid token type. Search API requires a User Token starting with "
-            f"'xoxp-', got token starting with '{slack_user_token[:5]}'"
-        )
-        return error_msg
+    # Get and validate the user token
+    try:
+        slack_user_token = _require_user_token(request.token)
+    except ValueError as e:
+        return str(e)
 
     logger.debug(
         "Starting Slack search", extra={"query": request.query, "channels": request.channels}
@@ -269,52 +573,18 @@ def search_slack(request: SlackSearchRequest) -> SlackSearchResult | str:
         return "Sort must be either 'timestamp' or 'score'"
 
     # Initialize Slack client
-    client = WebClient(token=slack_user_token)
+    client = _get_client(slack_user_token)
 
     try:
-        # Build the search query
-        search_query = request.query.strip()
-
-        # Add channel filters if specified
-        if request.channels:
-            # Convert comma separated channel list to array and format channels
-            formatted_channels = []
-            channel_list = request.channels.split(',')
-            for channel in channel_list:
-                channel = channel.strip()
-                if not channel.startswith('#'):
-                    formatted_channels.append(f"#{channel}")
-                else:
-                    formatted_channels.append(channel)
-
-            # Add channel filter to query
-            channel_filter = " ".join([f"in:{channel}" for channel in formatted_channels])
-            search_query = f"{search_query} {channel_filter}"
-
-        # Add time filters if specified (ISO format only)
-        if request.start_time:
-            try:
-                # Parse ISO format and convert to date string
-                dt = datetime.fromisoformat(request.start_time.replace('Z', '+00:00'))
-                start_date = dt.strftime('%Y-%m-%d')
-                search_query = f"{search_query} after:{start_date}"
-            except ValueError as e:
-                logger.warning(f"Invalid start_time ISO format: {request.start_time}, ignoring time filter")
-
-        if request.end_time:
-            try:
-                # Parse ISO format and convert to date string
-                dt = datetime.fromisoformat(request.end_time.replace('Z', '+00:00'))
-                end_date = dt.strftime('%Y-%m-%d')
-                search_query = f"{search_query} before:{end_date}"
-            except ValueError as e:
-                logger.warning(f"Invalid end_time ISO format: {request.end_time}, ignoring time filter")
-
-        logger.debug(f"Executing Slack search with query: '{search_query}'")
-        logger.debug(f"Search parameters - sort: {request.sort}, count: {request.count}")
+        search_query = _build_search_query(
+            request.query, request.channels, request.start_time, request.end_time
+        )
+
+        logger.debug("Executing Slack search with query: %r", search_query)
+        logger.debug("Search parameters - sort: %s, count: %d", request.sort, request.count)
 
         # Execute the search
-        response = client.search_messages(
+        response = await client.search_messages(
             query=search_query,
             sort=request.sort,
             count=request.count
@@ -322,55 +592,35 @@ def search_slack(request: SlackSearchRequest) -> SlackSearchResult | str:
 
         # Extract results
         messages = response.get("messages", {})
-        matches = messages.get("matches", [])
+        raw_matches = messages.get("matches", [])
         total = messages.get("total", 0)
         pagination = messages.get("pagination", {})
-        has_more = pagination.get("total_count", 0) > len(matches)
+        has_more = pagination.get("total_count", 0) > len(raw_matches)
 
         # Resolve user IDs to display names, handling Slack Connect users
-        user_ids = set()
-        for m in matches:
-            tid = m.get("team") or m.get("user_team")
-            uid = m.get("user")
-            if uid:
-                user_ids.add((uid, tid))
-            for ru in m.get("reply_users", []) or []:
-                user_ids.add((ru, tid))
-            for reaction in m.get("reactions", []) or []:
-                for ru in reaction.get("users", []) or []:
-                    user_ids.add((ru, tid))
-            for uid in MENTION_RE.findall(m.get("text") or ""):
-                user_ids.add((uid, tid))
-
-        user_map = {
-            (uid, tid): _get_user_name(client, uid, tid)
-            for uid, tid in user_ids
-        }
-
-        for m in matches:
-            tid = m.get("team") or m.get("user_team")
-            uid = m.get("user")
-            if uid:
-                resolved = user_map.get((uid, tid), uid)
-                m["user"] = resolved
-                m["username"] = resolved
-            if m.get("reply_users"):
-                m["reply_users"] = [
-                    user_map.get((ru, tid), ru) for ru in m.get("reply_users", [])
-                ]
-            for reaction in m.get("reactions", []) or []:
-                reaction["users"] = [
-                    user_map.get((ru, tid), ru) for ru in reaction.get("users", [])
-                ]
-
-            def _replace(match):
-                uid = match.group(1)
-                return "@" + user_map.get((uid, tid), uid)
+        # Only authors and mentions are rendered, so only they are resolved
+        user_ids = set(chain.from_iterable(map(_iter_author_refs, raw_matches)))
 
-            m["text"] = MENTION_RE.sub(_replace, m.get("text") or "")
+        user_map = await _resolve_users_bulk(client, user_ids)
 
-        logger.debug(f"Search completed - found {total} total results, returning {len(matches)} matches")
-        logger.debug(f"Results preview: {[match.get('text', '')[:50] + '...' for match in matches[:3]]}")
+        # Keep just the rendered fields so the raw response can be freed
+        get = user_map.get
+        matches = []
+        for m in raw_matches:
+            tid = _message_team(m)
+            uid = m.get("user")
+            text = _replace_mentions(m.get("text") or "", user_map, tid)
+            matches.append(SlackMatch(
+                channel=(m.get("channel") or {}).get("name", "unknown-channel"),
+                user=get((uid, tid), uid) if uid else "Unknown",
+                text=text[:MATCH_TEXT_LIMIT + 1],
+                ts=m.get("ts", ""),
+                permalink=m.get("permalink", ""),
+            ))
+
+        logger.debug("Search completed - found %d total results, returning %d matches", total, len(matches))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Results preview: %s", [match.text[:50] + '...' for match in matches[:3]])
 
         # Create structured result
         result = SlackSearchResult(
@@ -385,11 +635,73 @@ def search_slack(request: SlackSearchRequest) -> SlackSearchResult | str:
         return _format_search_results(result)
 
     except SlackApiError as e:
-        logger.error(f"Slack API error during search: {e.response['error']}")
-        return f"Slack API error: {e.response['error']}"
+        # Raise rather than return the error so tool_node reports it to the
+        # model without caching it
+        logger.error("Slack API error during search: %s", e.response['error'])
+        raise
     except Exception as e:
-        logger.error(f"Unexpected error during Slack search: {str(e)}")
-        return f"Error searching Slack: {str(e)}"
+        logger.error("Unexpected error during Slack search: %s", e)
+        raise
+
+def _format_search_error(search: SlackSearchRequest, error: BaseException) -> str:
+    """Describe a failed search from a batch in place of its results."""
+    if isinstance(error, SlackApiError):
+        error = f"Slack API error: {error.response['error']}"
+    return f"Search for '{search.query}' failed: {error}"
+
+async def search_slack_batch(request: SlackSearchBatchRequest) -> str:
+    """Run several Slack searches concurrently in a single tool call.
+
+    Use this to issue the global search and the channel-based searches
+    (one entry per keyword group) together instead of one search at a time.
+
+    Args:
+        request: SlackSearchBatchRequest with one SlackSearchRequest per search
+
+    Returns:
+        Formatted results of every search, in request order. A search that
+        fails is reported in its place without discarding the others.
+    """
+    searches = [
+        s if isinstance(s, SlackSearchRequest) else SlackSearchRequest(**s)
+        for s in request.searches
+    ]
+    if not searches:
+        return "At least one search is required"
+
+    results = await asyncio.gather(
+        *(search_slack(s) for s in searches), return_exceptions=True
+    )
+    return "\n\n".join(
+        _format_search_error(s, r) if isinstance(r, BaseException) else r
+        for s, r in zip(searches, results)
+    )
+
+def _format_ts(ts: str) -> str:
+    """Render a Slack ``ts`` as " (YYYY-MM-DD HH:MM)", or "" if it is not one."""
+    if not (ts and ts[0].isdigit()):
+        return ""
+    try:
+        return f" ({datetime.fromtimestamp(float(ts)).strftime(RESULT_TS_FORMAT)})"
+    except (ValueError, OverflowError, OSError):
+        return ""
+
+def _render(result: SlackSearchResult):
+    """Yield the lines of a non-empty search result, one string per match."""
+    yield f"Found {result.total} messages for query: '{result.query}'"
+    yield f"Showing top {len(result.matches)} results:\n"
+
+    for i, match in enumerate(result.matches, 1):
+        text = match.text
+        truncated = text[:MATCH_TEXT_LIMIT] + ('...' if len(text) > MATCH_TEXT_LIMIT else '')
+        link_part = f"\n   Link: {match.permalink}" if match.permalink else ""
+        yield (
+            f"{i}. #{match.channel} - @{match.user}{match.when}"
+            f"\n   {truncated}{link_part}\n"
+        )
+
+    if result.has_more:
+        yield f"... and {result.total - len(result.matches)} more results"
 
 def _format_search_results(result: SlackSearchResult) -> str:
     """Internal helper to format search results as a string.
@@ -404,40 +716,10 @@ def _format_search_results(result: SlackSearchResult) -> str:
         return f"No messages found for query: '{result.query}'"
 
     # Format results for LLM
-    output_lines = [
-        f"Found {result.total} messages for query: '{result.query}'",
-        f"Showing top {len(result.matches)} results:\n"
-    ]
-
-    for i, match in enumerate(result.matches, 1):
-        user = match.get('user', 'Unknown')
-        channel = match.get('channel', {}).get('name', 'unknown-channel')
-        text = match.get('text', '')[:200] + ('...' if len(match.get('text', '')) > 200 else '')
-        timestamp = match.get('ts', '')
-        permalink = match.get('permalink', '')
-
-        # Format each result
-        result_text = f"{i}. #{channel} - @{user}"
-        if timestamp:
-            try:
-                dt = datetime.fromtimestamp(float(timestamp))
-                result_text += f" ({dt.strftime('%Y-%m-%d %H:%M')})"
-            except:
-                pass
-
-        result_text += f"\n   {text}"
-        if permalink:
-            result_text += f"\n   Link: {permalink}"
-
-        output_lines.append(result_text + "\n")
-
-    if result.has_more:
-        output_lines.append(f"... and {result.total - len(result.matches)} more results")
-
-    return "\n".join(output_lines)
+    return "\n".join(_render(result))
 
 
-def get_thread_messages(params: ThreadInput) -> List[Dict[str, Any]]:
+async def get_thread_messages(params: ThreadInput) -> List[Dict[str, Any]]:
     """Get all messages from a Slack thread given its URL.
     
     Args:
@@ -452,25 +734,14 @@ def get_thread_messages(params: ThreadInput) -> List[Dict[str, Any]]:
     """
 
     thread_url = params.thread_url 
-    # Get API token from environment variable
-    slack_token = os.getenv("SLACK_USER_TOKEN")
-    if not slack_token:
-        raise ValueError("SLACK_USER_TOKEN environment variable is required")
-
-    # Validate that it's a user token
-    if not slack_token.startswith("xoxp-"):
-        raise ValueError("Invalid token type. API requires a User Token starting with 'xoxp-'")
-
     # Initialize Slack client
-    client = WebClient(token=slack_token)
+    client = _get_client(_require_user_token())
 
     try:
         # Extract channel ID and thread timestamp from URL
         # Example formats:
         #   https://xxx.slack.com/archives/CHANNEL_ID/p1234567890123456
         #   https://xxx.slack.com/archives/CHANNEL_ID/p1234567890123456?thread_ts=1234567890.123456&cid=CHANNEL_ID
-        from urllib.parse import urlparse, parse_qs
-
         parsed = urlparse(thread_url)
         path_parts = parsed.path.strip("/").split("/")
         if len(path_parts) < 3:
@@ -479,80 +750,88 @@ def get_thread_messages(params: ThreadInput) -> List[Dict[str, Any]]:
         channel_id = path_parts[-2]
         message_part = path_parts[-1]
 
-        if not message_part.startswith("p"):
+        ts_match = SLACK_TS_RE.match(message_part)
+        if not ts_match:
             raise ValueError("Invalid Slack thread URL format")
 
-        raw_ts = message_part[1:]
-        base_ts = raw_ts[:10] + "." + raw_ts[10:]
+        base_ts = f"{ts_match.group(1)}.{ts_match.group(2)}"
 
         # If the URL includes a thread_ts query param, use that as the parent timestamp
         query_ts = parse_qs(parsed.query).get("thread_ts", [base_ts])[0]
         thread_ts = query_ts
 
-        # Get thread messages
-        response = client.conversations_replies(
-            channel=channel_id,
-            ts=thread_ts,
-        )
-
-        messages = response.get("messages", [])
+        # Get thread messages page by page. Cursors are sequential, so pages
+        # are fetched in order, but each page's user IDs (authors, reply
+        # participants, reactors and mentions) are resolved while the next
+        # page is in flight.
+        messages: List[Dict[str, Any]] = []
+        seen_users: set = set()
+        seen_ts: set = set()
+        lookups: List[asyncio.Future] = []
+        cursor = None
+        try:
+            while True:
+                response = await client.conversations_replies(
+                    channel=channel_id,
+                    ts=thread_ts,
+                    cursor=cursor,
+                    limit=200,
+                )
+                # Every page repeats the thread parent; keep only its first copy
+                page = [
+                    m for m in response.get("messages", [])
+                    if m.get("ts") not in seen_ts
+                ]
+                seen_ts.update(m.get("ts") for m in page)
+                messages.extend(page)
+
+                user_ids = set(chain.from_iterable(map(_iter_user_refs, page))) - seen_users
+                seen_users |= user_ids
+                lookups.append(
+                    asyncio.ensure_future(_resolve_users_bulk(client, user_ids))
+                )
+
+                cursor = response.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+        except BaseException:
+            for lookup in lookups:
+                lookup.cancel()
+            raise
 
         # Log thread information
-        logger.debug(f"Retrieved {len(messages)} messages from thread")
+        logger.debug("Retrieved %d messages from thread", len(messages))
 
-        # Resolve user IDs to names, including participants in replies, reactions, and mentions
-        user_ids = set()
-        for m in messages:
-            tid = m.get("team") or m.get("user_team")
-            uid = m.get("user")
-            if uid:
-                user_ids.add((uid, tid))
-            for ru in m.get("reply_users", []) or []:
-                user_ids.add((ru, tid))
-            for reaction in m.get("reactions", []) or []:
-                for ru in reaction.get("users", []) or []:
-                    user_ids.add((ru, tid))
-            for uid in MENTION_RE.findall(m.get("text") or ""):
-                user_ids.add((uid, tid))
-
-        user_map = {
-            (uid, tid): _get_user_name(client, uid, tid)
-            for uid, tid in user_ids
-        }
+        user_map: Dict[tuple, str] = {}
+        for names in await asyncio.gather(*lookups):
+            user_map.update(names)
 
         # Return simplified message data
+        get = user_map.get
         thread_messages = []
         for msg in messages:
-            tid = msg.get("team") or msg.get("user_team")
+            tid = _message_team(msg)
             uid = msg.get("user")
 
-            def _replace(match):
-                uid = match.group(1)
-                return "@" + user_map.get((uid, tid), uid)
-
-            text = MENTION_RE.sub(_replace, msg.get("text") or "")
-
             thread_messages.append({
-                "text": text,
-                "user": user_map.get((uid, tid), uid),
+                "text": _replace_mentions(msg.get("text") or "", user_map, tid),
+                "user": get((uid, tid), uid),
                 "timestamp": msg.get("ts"),
                 "reply_count": msg.get("reply_count", 0),
                 "reply_users_count": msg.get("reply_users_count", 0),
-                "reply_users": [
-                    user_map.get((ru, tid), ru) for ru in msg.get("reply_users", []) or []
-                ],
+                "reply_users": [get((ru, tid), ru) for ru in msg.get("reply_users") or ()],
             })
 
-        logger.debug(f"Returning {len(thread_messages)} formatted messages")
+        logger.debug("Returning %d formatted messages", len(thread_messages))
         return thread_messages
 
     except SlackApiError as e:
         # Gracefully handle cases where the thread cannot be found
         error = e.response.get("error")
-        logger.error(f"Slack API error: {error}")
+        logger.error("Slack API error: %s", error)
         if error == "thread_not_found":
             return []
         raise
     except Exception as e:
-        logger.error(f"Unexpected error retrieving thread messages: {str(e)}")
+        logger.error("Unexpected error retrieving thread messages: %s", e)
         raise